@@ -1,13 +1,26 @@
 import logging
 import threading
+from functools import lru_cache
 from socketserver import BaseRequestHandler, ThreadingUDPServer
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
 from dnslib import QTYPE, RR, A, DNSHeader, DNSRecord
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _a_record(hostname: str, ip_address: str) -> RR:
+    """Build the A answer for a hostname, reusing it across queries.
+
+    Records are keyed on both name and address, so an updated IP simply gets
+    a new entry. RR objects are only read when packing, so sharing one
+    between concurrent replies is safe.
+    """
+    return RR(hostname, QTYPE.A, rdata=A(ip_address), ttl=60)
+
+
 class DNSRequestHandler(BaseRequestHandler):
     """Handles individual DNS requests."""
 
@@ -26,7 +39,10 @@ class DNSRequestHandler(BaseRequestHandler):
             qname = str(request.q.qname).rstrip(".")
             qtype = request.q.qtype
 
-            logger.debug(f"DNS query: {qname} ({QTYPE[qtype]})")
+            # Per-query logging uses lazy %-formatting so nothing is formatted
+            # (or looked up in QTYPE) unless debug logging is enabled
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("DNS query: %s (%s)", qname, QTYPE[qtype])
 
             # Create response
             reply = DNSRecord(
@@ -34,12 +50,12 @@ class DNSRequestHandler(BaseRequestHandler):
             )
 
             # Add answer if we have the record
-            if qtype == QTYPE.A and qname in self.dns_records:
-                ip_address = self.dns_records[qname]
-                reply.add_answer(RR(qname, QTYPE.A, rdata=A(ip_address), ttl=60))
-                logger.debug(f"Resolved {qname} -> {ip_address}")
+            ip_address = self.dns_records.get(qname)
+            if qtype == QTYPE.A and ip_address is not None:
+                reply.add_answer(_a_record(qname, ip_address))
+                logger.debug("Resolved %s -> %s", qname, ip_address)
             else:
-                logger.debug(f"No record found for {qname}")
+                logger.debug("No record found for %s", qname)
 
             # Send response
             socket.sendto(reply.pack(), self.client_address)
@@ -58,6 +74,9 @@ class DNSServerManager:
         self.server: Optional[ThreadingUDPServer] = None
         self.server_thread: Optional[threading.Thread] = None
         self._lock = threading.Lock()
+        # Read-only snapshot handed out by get_records(); rebuilt lazily after
+        # the next change so repeated reads don't copy the record table.
+        self._records_snapshot: Optional[Mapping[str, str]] = None
 
     def start(self) -> None:
         """Start the DNS server in a background thread."""
@@ -95,16 +114,25 @@ class DNSServerManager:
         """Add or update a DNS record."""
         with self._lock:
             self.dns_records[hostname] = ip_address
+            self._records_snapshot = None
             logger.info(f"Added DNS record: {hostname} -> {ip_address}")
 
     def remove_record(self, hostname: str) -> None:
         """Remove a DNS record."""
         with self._lock:
-            if hostname in self.dns_records:
-                del self.dns_records[hostname]
+            if self.dns_records.pop(hostname, None) is not None:
+                self._records_snapshot = None
                 logger.info(f"Removed DNS record: {hostname}")
 
-    def get_records(self) -> Dict[str, str]:
-        """Get a copy of all DNS records."""
+    def get_records(self) -> Mapping[str, str]:
+        """Get a read-only snapshot of all DNS records."""
+        # Reading the cached snapshot reference is atomic, so the common case
+        # of no changes since the last call does not need the lock
+        snapshot = self._records_snapshot
+        if snapshot is not None:
+            return snapshot
+
         with self._lock:
-            return self.dns_records.copy()
+            if self._records_snapshot is None:
+                self._records_snapshot = MappingProxyType(self.dns_records.copy())
+            return self._records_snapshot
@@ -199,8 +199,7 @@ class DNSSyncManager:
             hostname: DNS hostname to remove
         """
         with self._lock:
-            if hostname in self.local_dns_records:
-                del self.local_dns_records[hostname]
+            if self.local_dns_records.pop(hostname, None) is not None:
                 logger.info(f"Removed DNS record: {hostname}")
 
                 # Update local DNS server
@@ -294,9 +293,10 @@ class DNSSyncManager:
             updated_records = 0
             for hostname, record_data in dns_records.items():
                 # Only update if remote record is newer or we don't have it
-                if hostname not in self.local_dns_records or record_data.get(
+                local_record = self.local_dns_records.get(hostname)
+                if local_record is None or record_data.get(
                     "timestamp", 0
-                ) > self.local_dns_records.get(hostname, {}).get("timestamp", 0):
+                ) > local_record.get("timestamp", 0):
                     self.local_dns_records[hostname] = record_data
                     updated_records += 1
 
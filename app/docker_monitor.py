@@ -1,5 +1,6 @@
 import logging
 import threading
+from types import MappingProxyType
 from typing import Any, Callable, Dict, Optional
 
 import docker
@@ -7,6 +8,13 @@ from docker.errors import DockerException
 
 logger = logging.getLogger(__name__)
 
+# Container actions that add or remove a DNS record
+START_ACTIONS = frozenset(("start", "unpause"))
+STOP_ACTIONS = frozenset(("stop", "die", "pause", "destroy"))
+
+# Shared stand-in for a missing Config/Labels mapping in container attrs
+_EMPTY_MAPPING = MappingProxyType({})
+
 
 class DockerEventMonitor:
     """
@@ -112,9 +120,9 @@ class DockerEventMonitor:
         if not container_id:
             return
 
-        if action in ("start", "unpause"):
+        if action in START_ACTIONS:
             self._handle_container_start(container_id)
-        elif action in ("stop", "die", "pause", "destroy"):
+        elif action in STOP_ACTIONS:
             self._handle_container_stop(container_id)
 
     def _handle_container_start(self, container_id: str) -> None:
@@ -183,5 +191,6 @@ class DockerEventMonitor:
         Returns:
             Hostname string from 'joyride.host.name' label, or None if absent.
         """
-        labels = container.attrs.get("Config", {}).get("Labels", {})
+        config = container.attrs.get("Config") or _EMPTY_MAPPING
+        labels = config.get("Labels") or _EMPTY_MAPPING
         return labels.get("joyride.host.name")
@@ -1,8 +1,9 @@
+import ipaddress
 import logging
 import threading
-import time
 from pathlib import Path
-from typing import Callable, Dict, Optional
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -28,8 +29,12 @@ class HostsFileMonitor:
         self.poll_interval = poll_interval
         self.monitor_thread: Optional[threading.Thread] = None
         self.running = False
+        self._stop_event = threading.Event()
         self.current_records: Dict[str, str] = {}
         self._lock = threading.Lock()
+        # Parsed records per file, keyed by (mtime_ns, size) so unchanged
+        # files are not re-read on every poll
+        self._file_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, str]]] = {}
 
     def start(self) -> None:
         """Start monitoring hosts files."""
@@ -42,6 +47,7 @@ class HostsFileMonitor:
             return
 
         self.running = True
+        self._stop_event.clear()
         self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.monitor_thread.start()
         logger.info(f"Started hosts file monitor for directory: {self.hosts_directory}")
@@ -49,6 +55,7 @@ class HostsFileMonitor:
     def stop(self) -> None:
         """Stop monitoring hosts files."""
         self.running = False
+        self._stop_event.set()
         if self.monitor_thread:
             self.monitor_thread.join(timeout=5.0)
         logger.debug("Hosts file monitor stopped")
@@ -59,31 +66,32 @@ class HostsFileMonitor:
         self._load_all_hosts_files()
 
         while self.running:
+            # Wait on the stop event rather than sleeping so stop() wakes the
+            # thread immediately instead of blocking for a full poll interval
+            if self._stop_event.wait(self.poll_interval):
+                break
             try:
                 self._check_for_changes()
-                time.sleep(self.poll_interval)
             except Exception as e:
                 logger.error(f"Error in hosts file monitor: {e}")
-                time.sleep(self.poll_interval)
 
     def _check_for_changes(self) -> None:
         """Check for changes in hosts files."""
         new_records = self._load_hosts_records()
 
         with self._lock:
+            current_records = self.current_records
+
             # Find additions and updates
             for hostname, ip_address in new_records.items():
-                if (
-                    hostname not in self.current_records
-                    or self.current_records[hostname] != ip_address
-                ):
+                if current_records.get(hostname) != ip_address:
                     self.dns_callback("add", hostname, ip_address)
                     logger.debug(
                         f"Added/updated hosts record: {hostname} -> {ip_address}"
                     )
 
-            # Find removals
-            for hostname in list(self.current_records.keys()):
+            # Find removals (current_records is replaced below, never mutated)
+            for hostname in current_records:
                 if hostname not in new_records:
                     self.dns_callback("remove", hostname, "")
                     logger.debug(f"Removed hosts record: {hostname}")
@@ -104,23 +112,36 @@ class HostsFileMonitor:
     def _load_hosts_records(self) -> Dict[str, str]:
         """Load DNS records from all hosts files in the directory."""
         records: Dict[str, str] = {}
+        file_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, str]]] = {}
 
         if not self.hosts_directory.exists():
+            self._file_cache = file_cache
             return records
 
         # Find all files in the directory (skip hidden dotfiles for security)
         for file_path in self.hosts_directory.glob("*"):
             if file_path.is_file() and not file_path.name.startswith("."):
                 try:
-                    file_records = self._parse_hosts_file(file_path)
+                    stat = file_path.stat()
+                    signature = (stat.st_mtime_ns, stat.st_size)
+                    cached = self._file_cache.get(file_path)
+
+                    if cached is not None and cached[0] == signature:
+                        file_records = cached[1]
+                    else:
+                        file_records = self._parse_hosts_file(file_path)
+                        if file_records:
+                            logger.debug(
+                                f"Loaded {len(file_records)} records from {file_path.name}"
+                            )
+
+                    file_cache[file_path] = (signature, file_records)
                     records.update(file_records)
-                    if file_records:
-                        logger.debug(
-                            f"Loaded {len(file_records)} records from {file_path.name}"
-                        )
                 except Exception as e:
                     logger.error(f"Error reading hosts file {file_path}: {e}")
 
+        # Dropping the old cache forgets files that have been deleted
+        self._file_cache = file_cache
         return records
 
     def _parse_hosts_file(self, file_path: Path) -> Dict[str, str]:
@@ -136,19 +157,15 @@ class HostsFileMonitor:
         try:
             with open(file_path, "r", encoding="utf-8") as f:
                 for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-
-                    # Skip empty lines and comments
-                    if not line or line.startswith("#"):
-                        continue
-
-                    # Split on whitespace
+                    # split() already discards surrounding whitespace, so the
+                    # tokens never need stripping or empty checks
                     parts = line.split()
-                    if len(parts) < 2:
+
+                    # Skip empty lines, comments and lines without a hostname
+                    if len(parts) < 2 or parts[0].startswith("#"):
                         continue
 
                     ip_address = parts[0]
-                    hostnames = parts[1:]
 
                     # Validate IP address format (basic check)
                     if not self._is_valid_ip(ip_address):
@@ -158,10 +175,8 @@ class HostsFileMonitor:
                         continue
 
                     # Add all hostnames for this IP
-                    for hostname in hostnames:
-                        hostname = hostname.strip()
-                        if hostname:
-                            records[hostname] = ip_address
+                    for hostname in parts[1:]:
+                        records[hostname] = ip_address
 
         except Exception as e:
             logger.error(f"Error parsing hosts file {file_path}: {e}")
@@ -169,19 +184,18 @@ class HostsFileMonitor:
         return records
 
     def _is_valid_ip(self, ip_address: str) -> bool:
-        """Basic IP address validation."""
+        """Validate an IPv4 address using the stdlib parser."""
         try:
-            parts = ip_address.split(".")
-            if len(parts) != 4:
-                return False
-            for part in parts:
-                if not (0 <= int(part) <= 255):
-                    return False
+            ipaddress.IPv4Address(ip_address)
             return True
-        except (ValueError, AttributeError):
+        except ValueError:
             return False
 
-    def get_current_records(self) -> Dict[str, str]:
-        """Get a copy of current records from hosts files."""
-        with self._lock:
-            return self.current_records.copy()
+    def get_current_records(self) -> Mapping[str, str]:
+        """Get a read-only view of current records from hosts files.
+
+        current_records is replaced wholesale on every reload and never
+        mutated in place, so the view is a stable snapshot without a copy,
+        and reading the reference does not need the lock.
+        """
+        return MappingProxyType(self.current_records)
@@ -272,14 +272,17 @@ def detailed_status():
 def dns_records():
     """Get current DNS records"""
     records = dns_server.get_records()
-    dns_record_list = [
-        DNSRecord(hostname=hostname, ip_address=ip, ttl=300)
-        for hostname, ip in records.items()
-    ]
-    response = DNSRecordsResponse(
-        status="success",
-        total_records=len(records),
-        records=dns_record_list,
+    # Validate the whole record list in one pydantic-core pass rather than
+    # constructing a DNSRecord model per entry in Python
+    response = DNSRecordsResponse.model_validate(
+        {
+            "status": "success",
+            "total_records": len(records),
+            "records": [
+                {"hostname": hostname, "ip_address": ip, "ttl": 300}
+                for hostname, ip in records.items()
+            ],
+        }
     )
     return jsonify(response.model_dump())
 
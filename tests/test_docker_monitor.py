@@ -151,6 +151,15 @@ class TestDockerEventMonitor:
         hostname = monitor._get_container_hostname(mock_container_without_label)
         assert hostname is None
 
+    def test_get_container_hostname_with_null_labels(self, monitor):
+        """Test hostname extraction when Docker reports Labels as null."""
+        container = Mock()
+        container.attrs = {"Config": {"Labels": None}}
+        assert monitor._get_container_hostname(container) is None
+
+        container.attrs = {}
+        assert monitor._get_container_hostname(container) is None
+
     def test_process_existing_containers(self, monitor, dns_callback):
         """Test processing existing containers on startup."""
         mock_container1 = Mock()
@@ -2,6 +2,7 @@ import os
 import tempfile
 import time
 from pathlib import Path
+from unittest.mock import patch
 
 from app.hosts_monitor import HostsFileMonitor
 
@@ -74,6 +75,39 @@ class TestHostsFileMonitor:
         finally:
             os.unlink(hosts_file)
 
+    def test_unchanged_files_are_not_reparsed(self):
+        """Test that polling reuses parsed records for unchanged files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            monitor = HostsFileMonitor(temp_dir, lambda a, h, i: None)
+            hosts_file = Path(temp_dir) / "test.hosts"
+            with open(hosts_file, "w") as f:
+                f.write("192.168.1.100  cached.com\n")
+
+            with patch.object(
+                monitor, "_parse_hosts_file", wraps=monitor._parse_hosts_file
+            ) as mock_parse:
+                first = monitor._load_hosts_records()
+                second = monitor._load_hosts_records()
+
+                assert first == second == {"cached.com": "192.168.1.100"}
+                assert mock_parse.call_count == 1
+
+                # Rewriting the file changes its size and mtime
+                with open(hosts_file, "w") as f:
+                    f.write("192.168.1.200  cached.com other.com\n")
+
+                records = monitor._load_hosts_records()
+
+                assert mock_parse.call_count == 2
+                assert records == {
+                    "cached.com": "192.168.1.200",
+                    "other.com": "192.168.1.200",
+                }
+
+                # Deleted files drop out of the result
+                os.unlink(hosts_file)
+                assert monitor._load_hosts_records() == {}
+
     def test_is_valid_ip(self):
         """Test IP address validation."""
         monitor = HostsFileMonitor("/tmp", lambda a, h, i: None)
@@ -92,6 +126,9 @@ class TestHostsFileMonitor:
         assert monitor._is_valid_ip("192.168.1.1.1") is False
         assert monitor._is_valid_ip("not.an.ip") is False
         assert monitor._is_valid_ip("") is False
+        assert monitor._is_valid_ip("1_0.0.0.1") is False
+        assert monitor._is_valid_ip("+1.0.0.1") is False
+        assert monitor._is_valid_ip("::1") is False
 
     def test_monitor_lifecycle(self):
         """Test monitor start/stop lifecycle."""
@@ -122,6 +159,19 @@ class TestHostsFileMonitor:
             monitor.stop()
             assert not monitor.running
 
+    def test_stop_does_not_wait_for_poll_interval(self):
+        """Test that stop() wakes the monitor thread immediately."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            monitor = HostsFileMonitor(temp_dir, lambda a, h, i: None, poll_interval=30)
+            monitor.start()
+            time.sleep(0.1)
+
+            started = time.monotonic()
+            monitor.stop()
+
+            assert time.monotonic() - started < 1.0
+            assert not monitor.monitor_thread.is_alive()
+
     def test_file_changes_detection(self):
         """Test that file changes are detected and processed."""
         with tempfile.TemporaryDirectory() as temp_dir: